@@ -20,3 +20,6 @@ JUMP_STRENGTH = -10
 PIPE_SPEED = 3
 PIPE_GAP = 200
 PIPE_FREQUENCY = 1500  # milliseconds
+
+# Garbage collection
+GC_YOUNG_INTERVAL = 60  # frames between young collections when GC is managed
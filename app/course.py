@@ -0,0 +1,199 @@
+"""Pregenerated pipe courses for Flappy Bird.
+
+A course file holds one track of pipe gap positions per seed, so that many
+games (or headless evaluation workers) can replay exactly the same obstacles.
+Files are memory-mapped read-only, letting every process on a host share one
+page-cached copy instead of generating pipes itself.
+
+File layout (little-endian):
+
+- header: magic, format version, pipe gap, screen height, seed count,
+  track length
+- seed table: one signed 64-bit seed per track
+- track data: ``seed count * track length`` signed 16-bit top heights
+"""
+
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable
+from types import TracebackType
+from typing import Self
+
+from app.constants import PIPE_GAP, SCREEN_HEIGHT
+
+COURSE_MAGIC = b"FLAPCRS\x00"
+COURSE_VERSION = 2
+
+_HEADER = struct.Struct("<8sHHHII")
+_SEED = struct.Struct("<q")
+_HEIGHT_SIZE = 2
+
+
+def generate_track(seed: int, length: int) -> list[int]:
+    """Generate the pipe top heights for a single seed.
+
+    Heights are drawn from the same range ``Pipe`` uses for random pipes.
+    """
+    rng = random.Random(seed)
+    return [rng.randint(100, SCREEN_HEIGHT - PIPE_GAP - 100) for _ in range(length)]
+
+
+def generate_course(path: str, seeds: Iterable[int], length: int) -> None:
+    """Write a course file with one track of ``length`` pipes per seed.
+
+    The file is written next to ``path`` and then moved into place, so
+    processes that have the old course mapped keep reading the old data.
+    """
+    seed_list = list(seeds)
+    if not seed_list:
+        raise ValueError("A course needs at least one seed")
+    if len(set(seed_list)) != len(seed_list):
+        raise ValueError("Course seeds must be unique")
+    if length <= 0:
+        raise ValueError("Track length must be positive")
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    COURSE_MAGIC,
+                    COURSE_VERSION,
+                    PIPE_GAP,
+                    SCREEN_HEIGHT,
+                    len(seed_list),
+                    length,
+                )
+            )
+            f.writelines(_SEED.pack(seed) for seed in seed_list)
+            for seed in seed_list:
+                heights = array("h", generate_track(seed, length))
+                if sys.byteorder != "little":
+                    heights.byteswap()
+                f.write(heights.tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class Course:
+    """A read-only, memory-mapped set of pipe tracks keyed by seed."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._mmap: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is too small to be a course file")
+        magic, version, gap, screen_height, seed_count, length = _HEADER.unpack_from(
+            self._mmap
+        )
+        if magic != COURSE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a course file")
+        if version != COURSE_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported course version {version} in {path}")
+        if gap != PIPE_GAP:
+            self._mmap.close()
+            raise ValueError(
+                f"{path} was generated for pipe gap {gap}, expected {PIPE_GAP}"
+            )
+        if screen_height != SCREEN_HEIGHT:
+            self._mmap.close()
+            raise ValueError(
+                f"{path} was generated for screen height {screen_height}, "
+                f"expected {SCREEN_HEIGHT}"
+            )
+
+        self._length: int = length
+        self._data_offset: int = _HEADER.size + seed_count * _SEED.size
+        expected_size = self._data_offset + seed_count * length * _HEIGHT_SIZE
+        if len(self._mmap) != expected_size:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        self._seeds: dict[int, int] = {
+            _SEED.unpack_from(self._mmap, _HEADER.size + i * _SEED.size)[0]: i
+            for i in range(seed_count)
+        }
+
+    @property
+    def seeds(self) -> list[int]:
+        """Get the seeds stored in this course, in file order."""
+        return list(self._seeds)
+
+    @property
+    def length(self) -> int:
+        """Get the number of pipes in each track."""
+        return self._length
+
+    def track(self, seed: int) -> memoryview:
+        """Get the pipe top heights for a seed without copying them.
+
+        The view points straight into the mapped file, so it must be released
+        (or dropped) before the course is closed. Copy it, e.g. with
+        ``array("h", view)``, to keep the heights after closing.
+        """
+        if seed not in self._seeds:
+            raise KeyError(f"Seed {seed} is not in this course")
+        start = self._data_offset + self._seeds[seed] * self._length * _HEIGHT_SIZE
+        end = start + self._length * _HEIGHT_SIZE
+        with memoryview(self._mmap) as base, base[start:end] as raw:
+            if sys.byteorder != "little":
+                heights = array("h")
+                heights.frombytes(raw)
+                heights.byteswap()
+                return memoryview(heights)
+            return raw.cast("h")
+
+    def close(self) -> None:
+        """Unmap the course file.
+
+        Raises ``BufferError`` if a view returned by ``track`` is still alive;
+        the course then stays open and its views stay valid.
+        """
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Generate a course file from the command line."""
+    parser = argparse.ArgumentParser(description="Generate a Flappy Bird course.")
+    parser.add_argument("path", help="output course file")
+    parser.add_argument(
+        "--seeds", type=int, default=100, help="number of seeds, starting at 0"
+    )
+    parser.add_argument(
+        "--length", type=int, default=10000, help="number of pipes per seed"
+    )
+    args = parser.parse_args(argv)
+    if args.seeds <= 0:
+        parser.error("--seeds must be positive")
+    if args.length <= 0:
+        parser.error("--length must be positive")
+    generate_course(args.path, range(args.seeds), args.length)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Game class for Flappy Bird game."""
 
 import sys
+from array import array
 
 import pygame
 
@@ -16,13 +17,21 @@ from app.constants import (
     SKY_BLUE,
     WHITE,
 )
+from app.course import Course
+from app.gc_monitor import GCMonitor
 from app.pipe import Pipe
 
 
 class Game:
-    """Main game controller."""
+    """Main game controller.
 
-    def __init__(self) -> None:
+    When a course is given, pipe gaps are read from the track for ``seed``
+    instead of being randomized, wrapping around if the track runs out. The
+    track is copied out of the mapped file (two bytes per pipe), so the course
+    may be closed as soon as the game has been created.
+    """
+
+    def __init__(self, course: Course | None = None, seed: int = 0) -> None:
         self.screen: pygame.Surface = pygame.display.set_mode(
             (SCREEN_WIDTH, SCREEN_HEIGHT)
         )
@@ -30,6 +39,12 @@ class Game:
         self.clock: pygame.time.Clock = pygame.time.Clock()
         self.font: pygame.font.Font = pygame.font.Font(None, 50)
         self.small_font: pygame.font.Font = pygame.font.Font(None, 30)
+        self._track: array[int] | None = None
+        if course is not None:
+            with course.track(seed) as view:
+                self._track = array("h", view)
+        self._pipe_index: int
+        self._gc_monitor: GCMonitor | None = None
         self._bird: Bird
         self._pipes: list[Pipe]
         self._score: int
@@ -66,6 +81,9 @@ class Game:
         self._game_over = False
         self._paused = False
         self._last_pipe_time = pygame.time.get_ticks()
+        self._pipe_index = 0
+        if self._gc_monitor is not None:
+            self._gc_monitor.safe_point()
 
     def handle_events(self) -> bool:
         """Handle user input events."""
@@ -101,7 +119,7 @@ class Game:
         # Add new pipes
         current_time: int = pygame.time.get_ticks()
         if current_time - self._last_pipe_time > PIPE_FREQUENCY:
-            self._pipes.append(Pipe(SCREEN_WIDTH))
+            self._pipes.append(self._next_pipe())
             self._last_pipe_time = current_time
 
         # Update pipes
@@ -121,6 +139,14 @@ class Game:
             if pipe.is_off_screen():
                 self._pipes.remove(pipe)
 
+    def _next_pipe(self) -> Pipe:
+        """Create the next pipe, taking its gap from the course if there is one."""
+        if self._track is None:
+            return Pipe(SCREEN_WIDTH)
+        top_height: int = self._track[self._pipe_index % len(self._track)]
+        self._pipe_index += 1
+        return Pipe(SCREEN_WIDTH, top_height)
+
     def draw(self) -> None:
         """Draw all game elements."""
         # Draw background
@@ -217,14 +243,42 @@ class Game:
 
         pygame.display.flip()
 
-    def run(self) -> None:
-        """Run the main game loop."""
+    def run(self, manage_gc: bool = False, gc_report: str | None = None) -> None:
+        """Run the main game loop.
+
+        With ``manage_gc``, startup objects are frozen, young garbage is
+        collected every ``GC_YOUNG_INTERVAL`` frames and full collections only
+        run on the pause and game over screens and on reset. If
+        ``gc_report`` is given, per-frame GC and memory statistics are written
+        there as JSON when the game exits.
+        """
+        if manage_gc or gc_report is not None:
+            self._gc_monitor = GCMonitor(
+                managed=manage_gc, record=gc_report is not None
+            )
+            self._gc_monitor.start()
+
         running: bool = True
-        while running:
-            running = self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+        was_idle: bool = False
+        try:
+            while running:
+                running = self.handle_events()
+                self.update()
+                self.draw()
+                self.clock.tick(FPS)
+
+                if self._gc_monitor is not None:
+                    idle: bool = self._paused or self._game_over
+                    if idle and not was_idle:
+                        self._gc_monitor.safe_point()
+                    was_idle = idle
+                    self._gc_monitor.end_frame()
+        finally:
+            # Always hand the GC back, even if the loop raised
+            if self._gc_monitor is not None:
+                self._gc_monitor.stop()
+                if gc_report is not None:
+                    self._gc_monitor.write_report(gc_report)
 
         pygame.quit()
         sys.exit()
@@ -0,0 +1,204 @@
+"""Garbage collector control and per-frame memory instrumentation.
+
+Cyclic garbage collections, in particular of the oldest generation, can stall
+a frame for several milliseconds. ``GCMonitor`` can record how long
+collections take, how many run per generation and the process RSS for every
+frame. In managed mode it also freezes the objects that exist when the game
+starts and takes over scheduling of collections from the interpreter.
+"""
+
+import gc
+import json
+import os
+import time
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from app.constants import GC_YOUNG_INTERVAL
+
+_STATM_PATH = "/proc/self/statm"
+
+
+@dataclass(frozen=True, slots=True)
+class FrameStats:
+    """GC and memory statistics for a single frame."""
+
+    frame: int
+    frame_ms: float
+    gc_pause_ms: float
+    collections: tuple[int, int, int]
+    rss_bytes: int
+
+
+def _read_rss(fd: int) -> int:
+    """Read the current RSS in bytes from an open ``statm`` file descriptor."""
+    try:
+        return int(os.pread(fd, 64, 0).split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class GCMonitor:
+    """Optionally records GC pauses per frame and controls when GC runs.
+
+    In managed mode automatic collection is disabled. Instead, the young
+    generations are collected every ``GC_YOUNG_INTERVAL`` frames, which is
+    cheap and keeps cyclic garbage from piling up during play. Full collections
+    only run at safe points. The trade-off is that objects promoted to the
+    oldest generation during play are not reclaimed until the next safe point,
+    so a very long uninterrupted run grows memory and makes that collection
+    slower.
+
+    Samples are kept in flat arrays rather than one object per frame, so that
+    recording a long session does not itself grow the garbage-collected heap.
+    """
+
+    def __init__(self, managed: bool = False, record: bool = True) -> None:
+        self._managed: bool = managed
+        self._record: bool = record
+        self._frame_ms: array[float] = array("d")
+        self._gc_pause_ms: array[float] = array("d")
+        self._collections: tuple[array[int], array[int], array[int]] = (
+            array("q"),
+            array("q"),
+            array("q"),
+        )
+        self._rss_bytes: array[int] = array("q")
+        self._statm_fd: int = -1
+        self._gc_start: float = 0.0
+        self._frame_start: float = 0.0
+        self._frame_pause: float = 0.0
+        self._frame_collections: list[int] = [0, 0, 0]
+        self._frames_since_young: int = 0
+        self._was_enabled: bool = gc.isenabled()
+        self._running: bool = False
+
+    @property
+    def managed(self) -> bool:
+        """Get whether the monitor controls when collections run."""
+        return self._managed
+
+    @property
+    def recording(self) -> bool:
+        """Get whether per-frame statistics are recorded."""
+        return self._record
+
+    @property
+    def frame_count(self) -> int:
+        """Get the number of frames recorded so far."""
+        return len(self._frame_ms)
+
+    @property
+    def frames(self) -> list[FrameStats]:
+        """Get the statistics recorded so far, one entry per frame."""
+        return [self._frame(i) for i in range(self.frame_count)]
+
+    def start(self) -> None:
+        """Start the monitor and, in managed mode, take control of the GC.
+
+        Call this once long-lived objects such as fonts and surfaces have been
+        created so that they are frozen out of future collections.
+        """
+        if self._running:
+            return
+        self._running = True
+        if self._managed:
+            self._was_enabled = gc.isenabled()
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+        if self._record:
+            try:
+                self._statm_fd = os.open(_STATM_PATH, os.O_RDONLY)
+            except OSError:
+                self._statm_fd = -1
+            gc.callbacks.append(self._on_gc)
+        self._frame_start = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop the monitor and restore the previous GC configuration."""
+        if not self._running:
+            return
+        self._running = False
+        if self._record:
+            gc.callbacks.remove(self._on_gc)
+            if self._statm_fd >= 0:
+                os.close(self._statm_fd)
+                self._statm_fd = -1
+        if self._managed:
+            gc.unfreeze()
+            if self._was_enabled:
+                gc.enable()
+
+    def safe_point(self) -> None:
+        """Collect garbage now if the monitor controls the GC.
+
+        Only call this when a pause is not noticeable, e.g. while the game is
+        paused, over or being reset.
+        """
+        if self._managed and self._running:
+            gc.collect()
+            self._frames_since_young = 0
+
+    def end_frame(self) -> None:
+        """Finish a frame, collecting young garbage if due, and record it."""
+        if self._managed and self._running:
+            self._frames_since_young += 1
+            if self._frames_since_young >= GC_YOUNG_INTERVAL:
+                gc.collect(1)
+                self._frames_since_young = 0
+        if not self._record:
+            return
+        now = time.perf_counter()
+        self._frame_ms.append((now - self._frame_start) * 1000)
+        self._gc_pause_ms.append(self._frame_pause * 1000)
+        for generation in range(3):
+            self._collections[generation].append(self._frame_collections[generation])
+            self._frame_collections[generation] = 0
+        self._rss_bytes.append(_read_rss(self._statm_fd) if self._statm_fd >= 0 else 0)
+        self._frame_start = now
+        self._frame_pause = 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Get aggregate statistics over all recorded frames."""
+        return {
+            "managed": self._managed,
+            "frames": self.frame_count,
+            "total_gc_pause_ms": sum(self._gc_pause_ms),
+            "max_gc_pause_ms": max(self._gc_pause_ms, default=0.0),
+            "max_frame_ms": max(self._frame_ms, default=0.0),
+            "collections": [sum(column) for column in self._collections],
+            "peak_rss_bytes": max(self._rss_bytes, default=0),
+        }
+
+    def write_report(self, path: str) -> None:
+        """Write the summary and per-frame statistics to a JSON file."""
+        report = {
+            "summary": self.summary(),
+            "frames": [asdict(frame) for frame in self.frames],
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    def _frame(self, index: int) -> FrameStats:
+        """Build the statistics for one recorded frame."""
+        return FrameStats(
+            frame=index,
+            frame_ms=self._frame_ms[index],
+            gc_pause_ms=self._gc_pause_ms[index],
+            collections=(
+                self._collections[0][index],
+                self._collections[1][index],
+                self._collections[2][index],
+            ),
+            rss_bytes=self._rss_bytes[index],
+        )
+
+    def _on_gc(self, phase: str, info: dict[str, int]) -> None:
+        """Time a collection; registered in ``gc.callbacks``."""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif phase == "stop":
+            self._frame_pause += time.perf_counter() - self._gc_start
+            self._frame_collections[info["generation"]] += 1
@@ -20,11 +20,13 @@ if TYPE_CHECKING:
 class Pipe:
     """Represents a pipe obstacle."""
 
-    def __init__(self, x: int) -> None:
+    def __init__(self, x: int, top_height: int | None = None) -> None:
         self._x: int = x
         self._width: int = 70
         self._gap: int = PIPE_GAP
-        self._top_height: int = random.randint(100, SCREEN_HEIGHT - self._gap - 100)
+        if top_height is None:
+            top_height = random.randint(100, SCREEN_HEIGHT - self._gap - 100)
+        self._top_height: int = top_height
         self._bottom_y: int = self._top_height + self._gap
         self._passed: bool = False
 
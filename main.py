@@ -1,7 +1,10 @@
 """Main entry point for Flappy Bird game."""
 
+import argparse
+
 import pygame
 
+from app.course import Course
 from app.game import Game
 
 # Initialize Pygame
@@ -10,8 +13,32 @@ pygame.init()
 
 def main() -> None:
     """Run the Flappy Bird game."""
-    game: Game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Play Flappy Bird.")
+    parser.add_argument(
+        "--manage-gc",
+        action="store_true",
+        help="freeze startup objects and only collect garbage at safe points",
+    )
+    parser.add_argument(
+        "--gc-report", help="write per-frame GC and memory statistics to this file"
+    )
+    parser.add_argument("--course", help="play the pipes from this course file")
+    parser.add_argument(
+        "--seed", type=int, default=0, help="course seed to play (default: 0)"
+    )
+    args = parser.parse_args()
+
+    if args.course is None:
+        game: Game = Game()
+    else:
+        try:
+            with Course(args.course) as course:
+                game = Game(course, args.seed)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        except KeyError:
+            parser.error(f"seed {args.seed} is not in {args.course}")
+    game.run(manage_gc=args.manage_gc, gc_report=args.gc_report)
 
 
 if __name__ == "__main__":
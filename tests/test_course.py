@@ -0,0 +1,114 @@
+"""Tests for pregenerated pipe courses."""
+
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.constants import PIPE_GAP, SCREEN_HEIGHT
+from app.course import Course, generate_course, generate_track, main
+
+
+class TestCourse(unittest.TestCase):
+    """Test cases for course generation and loading."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "course.bin")
+        generate_course(self.path, [3, 1, 2], 50)
+
+    def tearDown(self) -> None:
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_generate_track_is_deterministic(self) -> None:
+        """Test the same seed always yields the same track."""
+        self.assertEqual(generate_track(7, 20), generate_track(7, 20))
+        self.assertNotEqual(generate_track(7, 20), generate_track(8, 20))
+
+    def test_generate_track_range(self) -> None:
+        """Test generated heights stay within the pipe range."""
+        for height in generate_track(0, 500):
+            self.assertGreaterEqual(height, 100)
+            self.assertLessEqual(height, SCREEN_HEIGHT - PIPE_GAP - 100)
+
+    def test_load(self) -> None:
+        """Test a generated course loads with its seeds and length."""
+        with Course(self.path) as course:
+            self.assertEqual(course.seeds, [3, 1, 2])
+            self.assertEqual(course.length, 50)
+
+    def test_track_matches_generator(self) -> None:
+        """Test tracks read back match the generated heights."""
+        with Course(self.path) as course:
+            for seed in course.seeds:
+                track = course.track(seed)
+                self.assertEqual(track.tolist(), generate_track(seed, 50))
+                track.release()
+
+    def test_close_with_live_view_raises(self) -> None:
+        """Test closing a course with a live view leaves the view usable."""
+        course = Course(self.path)
+        track = course.track(1)
+        with self.assertRaises(BufferError):
+            course.close()
+        self.assertEqual(track.tolist(), generate_track(1, 50))
+        track.release()
+        course.close()
+
+    def test_regenerate_keeps_open_course_valid(self) -> None:
+        """Test regenerating the file does not disturb a course mapping it."""
+        with Course(self.path) as course:
+            track = course.track(2)
+            generate_course(self.path, [9], 5)
+            self.assertEqual(track.tolist(), generate_track(2, 50))
+            track.release()
+        with Course(self.path) as course:
+            self.assertEqual(course.seeds, [9])
+        self.assertEqual(os.listdir(self.tmpdir.name), ["course.bin"])
+
+    def test_load_rejects_other_screen_height(self) -> None:
+        """Test loading a course made for another screen height fails."""
+        with patch("app.course.SCREEN_HEIGHT", SCREEN_HEIGHT + 100):
+            generate_course(self.path, [1], 10)
+        with self.assertRaises(ValueError):
+            Course(self.path)
+
+    def test_main_rejects_non_positive_arguments(self) -> None:
+        """Test the command line reports bad sizes as usage errors."""
+        for args in (["--seeds", "0"], ["--length", "0"]):
+            with (
+                self.assertRaises(SystemExit),
+                patch("sys.stderr", new_callable=io.StringIO),
+            ):
+                main([self.path, *args])
+
+    def test_track_unknown_seed(self) -> None:
+        """Test requesting a missing seed raises KeyError."""
+        with Course(self.path) as course, self.assertRaises(KeyError):
+            course.track(99)
+
+    def test_generate_invalid_arguments(self) -> None:
+        """Test generation rejects empty, duplicate or zero-length input."""
+        with self.assertRaises(ValueError):
+            generate_course(self.path, [], 10)
+        with self.assertRaises(ValueError):
+            generate_course(self.path, [1, 1], 10)
+        with self.assertRaises(ValueError):
+            generate_course(self.path, [1], 0)
+
+    def test_load_rejects_bad_magic(self) -> None:
+        """Test loading a file that is not a course raises ValueError."""
+        with open(self.path, "r+b") as f:
+            f.write(b"NOTACRS\x00")
+        with self.assertRaises(ValueError):
+            Course(self.path)
+
+    def test_load_rejects_truncated_file(self) -> None:
+        """Test loading a truncated course raises ValueError."""
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 2)
+        with self.assertRaises(ValueError):
+            Course(self.path)
@@ -1,11 +1,16 @@
 """Tests for the Game class."""
 
+import gc
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
 import pygame
 
+from app.course import Course, generate_course, generate_track
 from app.game import Game
+from app.gc_monitor import GCMonitor
 
 
 class TestGame(unittest.TestCase):
@@ -107,6 +112,91 @@ class TestGame(unittest.TestCase):
         # Bird should have moved
         self.assertNotEqual(self.game.bird.y, initial_bird_y)
 
+    def test_reset_is_gc_safe_point(self) -> None:
+        """Test reset collects garbage when the GC is managed."""
+        self.game._gc_monitor = unittest.mock.MagicMock(spec=GCMonitor)
+        self.game.reset()
+        self.game._gc_monitor.safe_point.assert_called_once()
+
+    @patch("pygame.quit")
+    @patch("sys.exit")
+    def test_run_writes_gc_report(
+        self, mock_exit: unittest.mock.MagicMock, mock_quit: unittest.mock.MagicMock
+    ) -> None:
+        """Test run records one frame per loop and writes the GC report."""
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch.object(self.game, "handle_events", side_effect=[True, False]),
+            patch.object(self.game, "draw"),
+        ):
+            path = os.path.join(tmpdir, "report.json")
+            self.game.run(manage_gc=True, gc_report=path)
+            self.assertTrue(os.path.exists(path))
+
+        assert self.game._gc_monitor is not None
+        self.assertEqual(self.game._gc_monitor.frame_count, 2)
+        mock_exit.assert_called_once()
+
+    def test_run_restores_gc_when_loop_raises(self) -> None:
+        """Test run hands the GC back and writes the report on an exception."""
+        gc_enabled = gc.isenabled()
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch.object(self.game, "handle_events", return_value=True),
+            patch.object(self.game, "update", side_effect=RuntimeError),
+        ):
+            path = os.path.join(tmpdir, "report.json")
+            with self.assertRaises(RuntimeError):
+                self.game.run(manage_gc=True, gc_report=path)
+            self.assertTrue(os.path.exists(path))
+
+        self.assertEqual(gc.isenabled(), gc_enabled)
+        self.assertEqual(gc.get_freeze_count(), 0)
+        assert self.game._gc_monitor is not None
+        self.assertNotIn(self.game._gc_monitor._on_gc, gc.callbacks)
+
+    @patch("pygame.quit")
+    @patch("sys.exit")
+    def test_run_managed_gc_without_report_records_nothing(
+        self, mock_exit: unittest.mock.MagicMock, mock_quit: unittest.mock.MagicMock
+    ) -> None:
+        """Test managing the GC alone keeps no per-frame statistics."""
+        with (
+            patch.object(self.game, "handle_events", side_effect=[True, True, False]),
+            patch.object(self.game, "draw"),
+        ):
+            self.game.run(manage_gc=True)
+
+        assert self.game._gc_monitor is not None
+        self.assertFalse(self.game._gc_monitor.recording)
+        self.assertEqual(self.game._gc_monitor.frame_count, 0)
+
+    def test_pipes_follow_course(self) -> None:
+        """Test pipes take their gaps from the course track and wrap around."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "course.bin")
+            generate_course(path, [5], 3)
+            course = Course(path)
+            with patch("pygame.display.set_mode"):
+                game = Game(course, 5)
+            heights = [game._next_pipe().top_height for _ in range(4)]
+            expected = generate_track(5, 3)
+            self.assertEqual(heights, expected + expected[:1])
+
+            # Reset restarts the course from its first pipe
+            game.reset()
+            self.assertEqual(game._next_pipe().top_height, expected[0])
+            course.close()
+
+    def test_course_can_close_while_game_alive(self) -> None:
+        """Test a course can be closed after a game has loaded a track from it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "course.bin")
+            generate_course(path, [0], 10)
+            with Course(path) as course, patch("pygame.display.set_mode"):
+                game = Game(course, 0)
+            self.assertEqual(game._next_pipe().top_height, generate_track(0, 10)[0])
+
     @patch("pygame.display.flip")
     def test_draw(self, mock_flip: unittest.mock.MagicMock) -> None:
         """Test draw completes without error."""
@@ -0,0 +1,139 @@
+"""Tests for the GCMonitor class."""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from app.constants import GC_YOUNG_INTERVAL
+from app.gc_monitor import GCMonitor
+
+
+class TestGCMonitor(unittest.TestCase):
+    """Test cases for the GCMonitor class."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.gc_enabled = gc.isenabled()
+
+    def tearDown(self) -> None:
+        """Restore the GC configuration."""
+        gc.unfreeze()
+        if self.gc_enabled:
+            gc.enable()
+
+    def test_records_collections(self) -> None:
+        """Test collections are attributed to the frame they happen in."""
+        monitor = GCMonitor()
+        monitor.start()
+        gc.collect()
+        monitor.end_frame()
+        monitor.end_frame()
+        monitor.stop()
+
+        self.assertEqual(len(monitor.frames), 2)
+        self.assertEqual(monitor.frames[0].collections[2], 1)
+        self.assertGreater(monitor.frames[0].gc_pause_ms, 0)
+        self.assertEqual(monitor.frames[1].collections, (0, 0, 0))
+        self.assertEqual(monitor.frames[1].gc_pause_ms, 0)
+
+    def test_stop_removes_callback(self) -> None:
+        """Test stop unregisters the GC callback."""
+        monitor = GCMonitor()
+        monitor.start()
+        monitor.stop()
+        gc.collect()
+        monitor.end_frame()
+        self.assertEqual(monitor.frames[0].collections, (0, 0, 0))
+
+    def test_unmanaged_leaves_gc_alone(self) -> None:
+        """Test unmanaged mode does not change the GC configuration."""
+        monitor = GCMonitor()
+        monitor.start()
+        self.assertEqual(gc.isenabled(), self.gc_enabled)
+        monitor.safe_point()
+        monitor.end_frame()
+        monitor.stop()
+        self.assertEqual(monitor.frames[0].collections, (0, 0, 0))
+
+    def test_managed_freezes_and_disables(self) -> None:
+        """Test managed mode freezes objects and disables automatic GC."""
+        gc.enable()
+        monitor = GCMonitor(managed=True)
+        monitor.start()
+        self.assertFalse(gc.isenabled())
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+        monitor.safe_point()
+        monitor.end_frame()
+        self.assertEqual(monitor.frames[0].collections[2], 1)
+
+        monitor.stop()
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_no_recording(self) -> None:
+        """Test a non-recording monitor keeps no frames but still manages GC."""
+        monitor = GCMonitor(managed=True, record=False)
+        monitor.start()
+        self.assertFalse(gc.isenabled())
+        monitor.safe_point()
+        monitor.end_frame()
+        monitor.stop()
+        self.assertEqual(monitor.frame_count, 0)
+        self.assertEqual(monitor.frames, [])
+
+    def test_samples_are_not_gc_tracked(self) -> None:
+        """Test recorded samples do not add objects to the tracked heap."""
+        monitor = GCMonitor()
+        monitor.start()
+        monitor.end_frame()
+        before = len(gc.get_objects())
+        for _ in range(1000):
+            monitor.end_frame()
+        after = len(gc.get_objects())
+        monitor.stop()
+        self.assertEqual(monitor.frame_count, 1001)
+        self.assertLess(after - before, 100)
+
+    def test_write_report(self) -> None:
+        """Test the report contains the summary and every frame."""
+        monitor = GCMonitor()
+        monitor.start()
+        gc.collect()
+        monitor.end_frame()
+        monitor.stop()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.json")
+            monitor.write_report(path)
+            with open(path) as f:
+                report = json.load(f)
+
+        self.assertEqual(report["summary"]["frames"], 1)
+        self.assertEqual(report["summary"]["collections"], [0, 0, 1])
+        self.assertEqual(len(report["frames"]), 1)
+        self.assertEqual(report["frames"][0]["frame"], 0)
+
+    def test_managed_collects_young_generations(self) -> None:
+        """Test managed mode collects the young generations periodically."""
+        monitor = GCMonitor(managed=True)
+        monitor.start()
+        for _ in range(GC_YOUNG_INTERVAL):
+            monitor.end_frame()
+        monitor.stop()
+
+        collections = [frame.collections for frame in monitor.frames]
+        self.assertEqual(collections[-1], (0, 1, 0))
+        self.assertEqual(sum(sum(c) for c in collections[:-1]), 0)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "requires /proc")
+    def test_records_rss(self) -> None:
+        """Test the current RSS is recorded for each frame on Linux."""
+        monitor = GCMonitor()
+        monitor.start()
+        monitor.end_frame()
+        monitor.stop()
+        self.assertGreater(monitor.frames[0].rss_bytes, 0)
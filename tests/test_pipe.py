@@ -27,6 +27,12 @@ class TestPipe(unittest.TestCase):
         self.assertGreaterEqual(self.pipe.top_height, 100)
         self.assertLessEqual(self.pipe.top_height, SCREEN_HEIGHT - self.pipe.gap - 100)
 
+    def test_initialization_with_top_height(self) -> None:
+        """Test pipe uses an explicit top height when given."""
+        pipe = Pipe(SCREEN_WIDTH, 150)
+        self.assertEqual(pipe.top_height, 150)
+        self.assertEqual(pipe.bottom_y, 150 + PIPE_GAP)
+
     def test_update(self) -> None:
         """Test update moves pipe left."""
         initial_x = self.pipe.x